@@ -0,0 +1,63 @@
+"""Export MantisBT history and route card issues to Word and PDF reports."""
+
+# Standard library imports
+import getpass
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# Local application imports
+from . import config
+from .report import convert_reports, render_issue
+from .scraper import MantisScraper
+
+__all__ = ["MantisScraper", "run"]
+
+logger = logging.getLogger(__name__)
+
+
+def run():
+    """Main function to orchestrate the scraping process."""
+    try:
+        if config.ENV == "debug":
+            # === Use in dev enironment only ===
+            username = config.APP_USERNAME
+            password = config.APP_PASSWORD
+            # === Use in dev enironment only ===
+
+        elif config.ENV == "production":
+            # Prompt for credentials
+            username = input("Enter your Mantis username: ")
+            password = getpass.getpass(prompt=f"Enter password for {username}: ")
+
+        with MantisScraper(config.BASE_URL, config.USERNAME_URL, config.PASSWORD_URL, username, password) as scraper:
+            scraper.login()
+            issues = scraper.get_issue_list(config.ISSUE_FILE)
+
+            # Issues are fetched concurrently, each report is rendered in a worker process as soon as its issue completes
+            with ThreadPoolExecutor(max_workers=config.ISSUE_WORKERS) as pool, ProcessPoolExecutor(max_workers=config.RENDER_WORKERS) as rendering_pool:
+                try:
+                    futures = [pool.submit(scraper.process_issue, issue) for issue in issues]
+                    render_futures = []
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result:
+                            render_futures.append(rendering_pool.submit(render_issue, *result, scraper.template_bytes))
+
+                    # Reports that fail to render are skipped, the rest are still converted to PDF
+                    document_paths = []
+                    for render_future in render_futures:
+                        try:
+                            document_paths.append(render_future.result())
+                        except Exception as e:
+                            logger.error(f"Failed to create report: {e}")
+                except BaseException:
+                    # Do not drain the remaining queued issues on an unexpected error or Ctrl+C
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    rendering_pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            # Save to PDF
+            convert_reports(document_paths)
+    except Exception as e:
+        logger.error(f"Script failed: {e}")
+        raise
@@ -0,0 +1,43 @@
+# Standard library imports
+import logging
+import os
+from pathlib import Path
+
+# Related third-party imports
+from dotenv import load_dotenv
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler()]
+)
+logger = logging.getLogger(__name__)
+
+# Load environment variables
+load_dotenv()
+ENV = os.getenv("APP_ENV", "production")
+
+# Constants
+BASE_URL = os.getenv("BASE_URL") or logger.error("BASE_URL not set in .env file") or exit(1)
+USERNAME_URL = os.getenv("USERNAME_URL") or logger.error("USERNAME_URL not set in .env file") or exit(1)
+PASSWORD_URL = os.getenv("PASSWORD_URL") or logger.error("PASSWORD_URL not set in .env file") or exit(1)
+
+if ENV == "debug":
+    APP_USERNAME = os.getenv("APP_USERNAME") or logger.error("APP_USERNAME not set in .env file") or exit(1)
+    APP_PASSWORD = os.getenv("APP_PASSWORD") or logger.error("APP_PASSWORD not set in .env file") or exit(1)
+
+REPORT_DIR = Path("reports")
+ATTACHEMENT_DIR = Path("attachements")
+ISSUE_FILE = Path("issue_list.toml")
+TEMPLATE_FILE = Path("hrc_report_template.docx")
+# Suffix of attachments that are still being downloaded
+PART_SUFFIX = ".part"
+
+# Number of issues fetched, scraped and downloaded at the same time
+ISSUE_WORKERS = 8
+# Number of attachments downloaded at the same time across all issues, this caps the load on the MantisBT host
+DOWNLOAD_WORKERS = 16
+# Number of processes rendering Word reports while the remaining issues are scraped
+RENDER_WORKERS = 2
@@ -0,0 +1,146 @@
+# Standard library imports
+import io
+import os
+from pathlib import Path
+from typing import List
+
+# Related third-party imports
+from docx import Document
+from docx.enum.table import WD_ROW_HEIGHT_RULE
+from docx.oxml.ns import qn
+from docx.oxml import OxmlElement
+from docx.shared import Cm, Pt
+from docx.text.paragraph import Paragraph
+from docx2pdf import convert
+
+# Local application imports
+from .config import ATTACHEMENT_DIR, PART_SUFFIX
+
+
+def new_issue_data() -> dict:
+    """Build a fresh report field layout for a single issue.
+
+    Every key contains the row no, column no and (later) text to be added to the report table cell.
+    The custom fields are the twelve route card rows starting at row 11.
+    """
+    return {
+        "id": [1, 0],
+        "project":[1, 1],
+        "category":[1, 2],
+        "view-status":[1, 3],
+        "date-submitted":[1, 4],
+        "last-modified":[1, 5],
+        "reporter":[3, 1],
+        "assigned-to":[3, 3],
+        "priority":[4, 1],
+        "severity":[4, 3],
+        "reproducibility":[4, 5],
+        "status":[5, 1],
+        "resolution":[5, 3],
+        "summary":[7, 1],
+        "description":[8, 1],
+        "steps-to-reproduce":[9, 1],
+        "custom-field":{index: [11 + index, 1] for index in range(12)},
+    }
+
+def add_hyperlink(paragraph: Paragraph, url: str, text: str):
+    """Add a hyperlink to a paragraph in a Word document.
+
+    Args:
+        paragraph (Paragraph): The paragraph to add the hyperlink to (e.g., in a table cell or document body).
+        url (str): The URL for the hyperlink.
+        text (str): The display text for the hyperlink.
+    """
+    # Add a relationship for the hyperlink
+    part = paragraph.part
+    r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
+
+    # Create the w:hyperlink tag
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+
+    # Create a run element for the hyperlink text
+    run = OxmlElement('w:r')
+    rPr = OxmlElement('w:rPr')
+
+    # Add hyperlink style (blue, underlined)
+    rStyle = OxmlElement('w:rStyle')
+    rStyle.set(qn('w:val'), 'Hyperlink')
+    rPr.append(rStyle)
+
+    # Add the text to the run
+    t = OxmlElement('w:t')
+    t.text = text
+    run.append(rPr)
+    run.append(t)
+    hyperlink.append(run)
+
+    # Add the hyperlink to the paragraph
+    paragraph._element.append(hyperlink)
+
+def render_issue(issue_data:dict, report_path: Path, issue_url: str, template_bytes: bytes) -> Path:
+    """Populate and save the Word report for a single issue.
+
+    This is a module level function so it can be run in a separate process while the next issues are scraped.
+
+    Args:
+        issue_data (dict): The scraped issue data from MantisScraper.get_report_data.
+        report_path (Path): The issue folder to save the report in.
+        issue_url (str): The issue page URL, linked from the report ID cell.
+        template_bytes (bytes): The contents of the report template.
+
+    Returns:
+        Path: The path of the saved Word report.
+    """
+    document = Document(io.BytesIO(template_bytes))
+
+    style = document.styles['Normal']
+    font = style.font
+    font.name = "Aptos (Body)"
+    font.size = Pt(8)
+
+    _table = (document.tables)[0]
+
+    for key, value in issue_data.items():
+        if key == "id":
+            # Add id cell data with hyperlink
+            row, column, text = value
+            id_cell_paragraph = _table.cell(row, column).paragraphs[0]
+            add_hyperlink(id_cell_paragraph, issue_url, text)
+        elif key == "custom-field":
+            for row, column, text in value.values():
+                _table.cell(row, column).text = text
+        else:
+            row, column, text = value
+            _table.cell(row, column).text = text
+
+    # Style table row height
+    for index, row in enumerate(_table.rows):
+        if index <= 7 or index >= 10:
+            row.height = Cm(0.5)
+            row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
+
+    # The attachment folder is flat, so a single scandir lists every downloaded file
+    attachment_path = report_path / ATTACHEMENT_DIR
+    if attachment_path.exists():
+        with os.scandir(attachment_path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith(PART_SUFFIX):
+                    _par = document.add_paragraph()
+                    add_hyperlink(_par, f"{ATTACHEMENT_DIR}/{entry.name}", entry.name)
+
+    document_file_name = f"{issue_data["category"][2]}-{issue_data["custom-field"][11][2]}.docx"
+    document_path = report_path / document_file_name
+    document.save(document_path)
+    return document_path
+
+def convert_reports(document_paths: List[Path]) -> None:
+    """Convert the created Word reports to PDF.
+
+    Word is kept open between conversions so it is only started once for the whole run.
+
+    Args:
+        document_paths (List[Path]): The Word reports to convert, each PDF is saved next to its report.
+    """
+    for index, document_path in enumerate(document_paths, 1):
+        convert(document_path, keep_active=index < len(document_paths))
@@ -0,0 +1,321 @@
+# Standard library imports
+import logging
+import os
+import re
+import shutil
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+from urllib.parse import urljoin
+from uuid import uuid4
+
+# Related third-party imports
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Local application imports
+from .config import ATTACHEMENT_DIR, DOWNLOAD_WORKERS, PART_SUFFIX, REPORT_DIR, TEMPLATE_FILE
+from .report import new_issue_data
+
+
+logger = logging.getLogger(__name__)
+
+# The field layout is fixed, so the td class to report key lookup is built once at import
+FIELD_CLASSES = {f"bug-{key}": key for key in new_issue_data() if key != "custom-field"}
+
+# Characters replaced with underscores in report folder names and attachment file names
+PATH_SANITIZE = re.compile(r'[<>:"/\\|?*]')
+FILENAME_SANITIZE = re.compile(r'[^\w\.-]')
+
+# Prefer the C-based lxml parser, the standard library parser is a slower fallback if it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only the page title, the bug-* table cells and the attachment links are read from an issue page
+STRAINER = SoupStrainer(["title", "td", "a"])
+
+
+class MantisScraper:
+    """A class to scrape issues and download files from a MantisBT instance."""
+    
+    def __init__(self, base_url: str, username_url: str, password_url: str, username: str, password: str):
+        self.base_url = base_url.rstrip('/')
+        # URL prefixes built once for the issue pages and for resolving attachment links
+        self.issue_url_format = f"{self.base_url}/view.php?id=%s"
+        self.base_prefix = f"{self.base_url}/"
+        self.username_url = username_url
+        self.password_url = password_url
+        self.username = username
+        self.password = password
+        # Directories already created this run, so repeated issues and downloads skip the mkdir call
+        self.created_dirs: Set[Path] = set()
+        self.make_dir(REPORT_DIR)
+        # The template is read once, every report still gets its own Document parsed from these bytes
+        self.template_bytes = TEMPLATE_FILE.read_bytes()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Issue pages compress well, only offer encodings urllib3 can decode without extra packages
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept': 'text/html,application/xhtml+xml,*/*',
+            'Connection': 'keep-alive',
+        })
+        # Enlarge the connection pool so concurrent downloads can reuse kept-alive connections,
+        # and retry rate limits and transient server errors instead of failing the issue.
+        # Backoff is exponential, capped and jittered so concurrent workers do not retry in lockstep.
+        # Only one host is scraped, so few pools are needed but each must hold every concurrent connection.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_max=60,
+            backoff_jitter=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Shared by every issue so the number of in-flight downloads does not grow with ISSUE_WORKERS
+        self.download_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.download_pool.shutdown()
+        self.session.close()
+        logger.info("Session closed.\n")
+    
+    def make_dir(self, path: Path) -> None:
+        """Create a directory, unless it was already created by this scraper."""
+        if path not in self.created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self.created_dirs.add(path)
+
+    def get_issue_list(self, file_path: Path) -> Tuple[str, ...]:
+        """Read issue numbers from a file, returned as a tuple without duplicates since they are only iterated."""
+        try:
+            if not file_path.is_file():
+                raise FileNotFoundError(f"Issue list file {file_path} does not exist.")
+            with file_path.open("rb") as f:
+                data = tomllib.load(f)
+                issues = data["active_issues"]
+            # Issues are processed concurrently, so a duplicate ID would race on its own report folder
+            unique_issues = tuple(dict.fromkeys(issues))
+            if len(unique_issues) != len(issues):
+                logger.warning(f"Dropped {len(issues) - len(unique_issues)} duplicate issues from {file_path}")
+            logger.info(f"Loaded {len(unique_issues)} issues from {file_path}\n")
+            return unique_issues
+        except Exception as e:
+            logger.error(f"Failed to read issue list: {e}\n")
+            raise
+
+    def login(self) -> None:
+        """Log in to the MantisBT instance."""
+        try:
+            # Step 1: Submit username
+            username_payload = {"return": "index.php", "username": self.username}
+            response = self.session.post(self.username_url, data=username_payload, timeout=10)
+            response.raise_for_status()
+            if f"Enter password for '{self.username}'".encode("utf-8") not in response.content:
+                raise ValueError("Username submission failed.")
+
+            # Step 2: Submit password
+            password_payload = {"return": "login.php", "username": self.username, "password": self.password}
+            response = self.session.post(self.password_url, data=password_payload, timeout=10)
+            response.raise_for_status()
+            if b"Assigned to Me (Unresolved)" not in response.content:
+                raise ValueError("Login unsuccessful.")
+            logger.info("Login successful.\n")
+        except requests.RequestException as e:
+            logger.error(f"Login failed: {e}\n")
+            raise
+
+    def access_issue_page(self, issue: str) -> Optional[Tuple[requests.Response, str]]:
+        """Access a protected issue page."""
+        try:
+            issue_url = self.issue_url_format % issue
+            response = self.session.get(issue_url, timeout=10)
+            response.raise_for_status()
+            if b"View Issue Details" not in response.content:
+                logger.error(f"Failed to access issue page {issue}")
+                return None
+            print("")
+            logger.info(f"Successfully accessed issue page {issue}")
+            return response, issue_url
+        except requests.RequestException as e:
+            logger.error(f"Error accessing issue {issue}: {e}\n")
+            return None
+
+    def scrape_page(self, response: requests.Response, issue: str) -> Tuple[dict, Path, List[Tuple[str, str]]]:
+        """Scrape issue page content and save as HTML.
+
+        Only plain data is returned, so the parsed page can be freed before the attachments are downloaded.
+
+        Returns:
+            Tuple[dict, Path, List[Tuple[str, str]]]: The scraped issue data, the issue report folder
+                and the unique (href, text) attachment links found while the page was parsed.
+        """
+        try:
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=STRAINER)
+            issue_no = soup.title.text.split(':')[0]
+            
+            _category_no = "".join(soup.select_one("td.bug-category").text.split())
+            category_no = PATH_SANITIZE.sub('_', f"{_category_no}_({issue_no})")
+
+            report_path = REPORT_DIR / category_no
+            self.make_dir(report_path)
+
+            # Save the full HTML report byte for byte as received, the parsed soup only holds the strained tags
+            (report_path / f"{issue_no}_report.html").write_bytes(response.content)
+            logger.info(f"Saved HTML report for issue {issue_no}")
+
+            issue_data = new_issue_data()
+            self.get_report_data(issue_data, soup)
+            return issue_data, report_path, self.get_unique_links(soup)
+        except Exception as e:
+            logger.error(f"Error scraping issue {issue}: {e}")
+            raise
+    
+    def get_report_data(self, issue_data:dict, soup: BeautifulSoup) -> None:
+        """Add the scraped text for every report field to issue_data in one pass over the table cells.
+
+        Args:
+            issue_data (dict): A fresh report field layout from new_issue_data, updated in place.
+            soup (BeautifulSoup): The parsed issue page.
+        """
+        last_by_key = {}
+        custom_texts = []
+
+        for td in soup.find_all("td"):
+            td_class = td.get("class")
+            if not td_class or len(td_class) != 1:
+                continue
+            if td_class[0] == "bug-custom-field":
+                custom_texts.append(td.get_text().strip())
+                continue
+            key = FIELD_CLASSES.get(td_class[0])
+            if key:
+                # Later cells overwrite earlier ones, the last match on the page is used
+                last_by_key[key] = td.get_text().strip()
+
+        for key, tag_text in last_by_key.items():
+            issue_data[key].append(tag_text)
+        for index, tag_text in enumerate(custom_texts):
+            issue_data["custom-field"][index].append(tag_text)
+
+    def get_unique_links(self, soup: BeautifulSoup) -> List[Tuple[str, str]]:
+        """Find the downloadable file links on an issue page, unique with no duplicates
+
+        Args:
+            soup (BeautifulSoup): The parsed issue page
+
+        Returns:
+            List[Tuple[str, str]]: The href and text of every link with a unique href, in page order
+        """
+        try:
+            # Dedupe on the href string, hashing and comparing Tag objects is far more expensive
+            unique_links = {}
+            for link in soup.select('a[href*="file_download.php"]'):
+                href = link["href"]
+                if href not in unique_links and len(link.attrs) == 1 and link.find() is None:
+                    link_text = link.get_text()
+                    if link_text.strip():
+                        unique_links[href] = link_text
+            return list(unique_links.items())
+        except Exception as e:
+            logger.error(e)
+            raise
+
+    def download_multiple_type_files(self, report_path: Path, file_links: List[Tuple[str, str]]) -> None:
+        """Download files from provided links."""
+        if not file_links:
+            logger.warning("No file links found.")
+            return
+
+        logger.info(f"Found {len(file_links)} file links.")
+
+        attachment_path = report_path / ATTACHEMENT_DIR
+        self.make_dir(attachment_path)
+
+        downloads = []
+        for index, (relative_url, link_text) in enumerate(file_links, 1):
+            file_url = urljoin(self.base_prefix, relative_url)
+
+            file_basename, _file_extension = os.path.splitext(link_text)
+            file_extension = _file_extension.lstrip('.')
+            
+            # This regex sanitizes the file name text:
+                # input:    My new:file/name.pdf
+                # output:   My_new_file_name.pdf
+            filename = FILENAME_SANITIZE.sub('_', f"{index}_{file_basename.strip()}.{file_extension}" or f"{index}_file.{file_extension}")
+            file_path = attachment_path / filename
+            # Attachments saved by a previous run are not downloaded again
+            if file_path.is_file() and file_path.stat().st_size > 0:
+                logger.info(f"Skipping {filename}, already downloaded")
+                continue
+            downloads.append((file_url, file_path))
+
+        list(self.download_pool.map(self._fetch_one, downloads))
+
+    def _fetch_one(self, download: Tuple[str, Path]) -> None:
+        """Download a single file to disk.
+
+        Args:
+            download (Tuple[str, Path]): The file URL and the local path to save it to.
+        """
+        file_url, file_path = download
+        # Write to a temporary file first, so an interrupted download never leaves a truncated attachment
+        # that a later run would skip as already downloaded. Every download gets its own temporary file.
+        part_path = file_path.with_name(f"{file_path.name}.{uuid4().hex}{PART_SUFFIX}")
+        try:
+            logger.info(f"Downloading {file_path.name} from {file_url}")
+            # Stream the body to disk instead of holding the whole file in memory,
+            # the raw stream still has to undo any gzip/deflate transfer encoding
+            with self.session.get(file_url, timeout=(5, 30), allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with part_path.open("wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 256)
+            part_path.replace(file_path)
+            logger.info(f"Saved {file_path.name}")
+        except (requests.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            # Reading response.raw raises urllib3 errors directly when the connection drops mid-file,
+            # disk and rename errors only fail this file instead of the whole run
+            part_path.unlink(missing_ok=True)
+            logger.error(f"Failed to download {file_url}: {e}")
+
+    def process_issue(self, issue: str) -> Optional[Tuple[dict, Path, str]]:
+        """Fetch and scrape a single issue and download its attachments.
+
+        Args:
+            issue (str): The issue ID to process.
+
+        Returns:
+            Optional[Tuple[dict, Path, str]]: The scraped issue data, report path and issue URL
+                needed to populate the report, or None if the issue could not be accessed or scraped.
+        """
+        page = self.access_issue_page(issue)
+        if page is None:
+            return None
+        response, issue_url = page
+
+        try:
+            issue_data, report_path, file_links = self.scrape_page(response, issue)
+            # The page body is archived and scraped, release it before the attachments are downloaded
+            del page, response
+
+            self.download_multiple_type_files(report_path, file_links)
+            return issue_data, report_path, issue_url
+        except Exception as e:
+            # One broken issue page must not stop the other issues from being exported
+            logger.error(f"Skipping issue {issue}: {e}\n")
+            return None